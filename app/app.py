@@ -1,12 +1,21 @@
+import hashlib
+import html
 import os
 import re
+import string
+import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from xml.sax.saxutils import escape
 
 import joblib
+import numpy as np
 import streamlit as st
 from docx import Document
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
+from scipy.sparse import csr_matrix
 
 
 # ---------------- PATH SETUP ----------------
@@ -27,159 +36,317 @@ VECTORIZER_PATH = os.path.join(
     "tfidf_vectorizer.pkl",
 )
 
-model = joblib.load(MODEL_PATH)
-tfidf = joblib.load(VECTORIZER_PATH)
+
+# TfidfVectorizer's default token_pattern.
+_DEFAULT_TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+
+def _read_artifacts():
+    """
+    Read the trained classifier and TF-IDF vectorizer from disk.
+    """
+    model = joblib.load(MODEL_PATH, mmap_mode="r")
+    tfidf = joblib.load(VECTORIZER_PATH, mmap_mode="r")
+
+    # clean_text already lowercases and leaves only letters separated by
+    # single spaces, so for unigram word features splitting on whitespace
+    # yields the same vocabulary tokens as the default regex tokenizer.
+    if (
+        tfidf.analyzer == "word"
+        and tuple(tfidf.ngram_range) == (1, 1)
+        and tfidf.token_pattern == _DEFAULT_TOKEN_PATTERN
+        and tfidf.tokenizer is None
+        and tfidf.preprocessor is None
+    ):
+        tfidf.set_params(
+            tokenizer=str.split,
+            token_pattern=None,
+            lowercase=False,
+        )
+
+    return model, tfidf
+
+
+@st.cache_resource
+def _start_artifact_loading():
+    """
+    Start reading the model artifacts on a background thread, once per
+    process, so unpickling overlaps with rendering the first page.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=1,
+        thread_name_prefix="artifact-loader",
+    )
+    future = executor.submit(_read_artifacts)
+    executor.shutdown(wait=False)
+    return future
+
+
+def _load_artifacts():
+    """
+    Return the loaded classifier and vectorizer, waiting for the
+    background load if it is still running.
+    """
+    try:
+        return _start_artifact_loading().result()
+    except Exception:
+        _start_artifact_loading.clear()
+        raise
+
+
+_start_artifact_loading()
 
 
 # ---------------- UI STYLING ----------------
 
+_RAW_CSS = """
+    body {
+        background-color: #0f172a;
+    }
+
+    .main {
+        background-color: #0f172a;
+        color: #e5e7eb;
+    }
+
+    h1, h2, h3 {
+        color: #f8fafc;
+    }
+
+    .stButton > button {
+        background-color: #22c55e;
+        color: white;
+        border-radius: 8px;
+        padding: 0.5em 1.2em;
+        border: none;
+        font-weight: bold;
+    }
+
+    .stButton > button:hover {
+        background-color: #16a34a;
+        color: white;
+    }
+
+    textarea {
+        border-radius: 8px !important;
+    }
+
+    .block-container {
+        padding-top: 2rem;
+        padding-bottom: 2rem;
+    }
+
+    .result-box {
+        background-color: #022c22;
+        padding: 1rem;
+        border-radius: 8px;
+        color: #bbf7d0;
+        font-weight: bold;
+        margin-top: 1rem;
+    }
+"""
+
+
+def _minify_css(css):
+    """
+    Strip comments and redundant whitespace from a CSS stylesheet.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+_MINIFIED_CSS = _minify_css(_RAW_CSS)
+
+
 def load_css():
     """
     Apply custom CSS for professional UI.
     """
-    st.markdown(
-        """
-        <style>
-        body {
-            background-color: #0f172a;
-        }
-
-        .main {
-            background-color: #0f172a;
-            color: #e5e7eb;
-        }
-
-        h1, h2, h3 {
-            color: #f8fafc;
-        }
-
-        .stButton > button {
-            background-color: #22c55e;
-            color: white;
-            border-radius: 8px;
-            padding: 0.5em 1.2em;
-            border: none;
-            font-weight: bold;
-        }
-
-        .stButton > button:hover {
-            background-color: #16a34a;
-            color: white;
-        }
-
-        textarea {
-            border-radius: 8px !important;
-        }
-
-        .block-container {
-            padding-top: 2rem;
-            padding-bottom: 2rem;
-        }
-
-        .result-box {
-            background-color: #022c22;
-            padding: 1rem;
-            border-radius: 8px;
-            color: #bbf7d0;
-            font-weight: bold;
-            margin-top: 1rem;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.html(f"<style>{_MINIFIED_CSS}</style>")
 
 
 # ---------------- TEXT CLEANING ----------------
 
+_NON_ALPHA_RE = re.compile(r"[^a-z\s]+")
+
+# Byte values removed from lowercased ASCII text: everything that is
+# neither a lowercase letter nor whitespace.
+_ASCII_DELETE_BYTES = bytes(
+    code
+    for code in range(256)
+    if not (code < 128 and (chr(code).islower() or chr(code).isspace()))
+)
+
 def clean_text(text):
     """
     Clean input text by removing numbers and symbols,
     converting to lowercase, and removing extra spaces.
     """
-    text = str(text).lower()
-    text = re.sub(r"\d+", "", text)
-    text = re.sub(r"[^a-zA-Z\s]", "", text)
-    text = re.sub(r"\s+", " ", text)
-    return text
+    text = str(text)
+
+    if text.isascii():
+        data = text.encode("ascii").lower()
+        text = data.translate(None, _ASCII_DELETE_BYTES).decode("ascii")
+    else:
+        text = _NON_ALPHA_RE.sub("", text.lower())
+
+    return " ".join(text.split())
+
+
+# ---------------- FEATURE EXTRACTION ----------------
+
+@st.cache_resource
+def _load_vectorizer_index():
+    """
+    Precompute the analyzer, vocabulary, and IDF weights needed to
+    vectorize a single document without calling tfidf.transform.
+    Returns None when the vectorizer settings are not supported.
+    """
+    _, tfidf = _load_artifacts()
+
+    if (
+        tfidf.norm != "l2"
+        or not tfidf.use_idf
+        or tfidf.sublinear_tf
+        or tfidf.binary
+        or tfidf.dtype != np.float64
+    ):
+        return None
+
+    return tfidf.build_analyzer(), tfidf.vocabulary_, tfidf.idf_
+
+
+def vectorize_text(text):
+    """
+    Convert cleaned text into a single-row TF-IDF matrix.
+    """
+    index = _load_vectorizer_index()
+    if index is None:
+        _, tfidf = _load_artifacts()
+        return tfidf.transform([text])
+
+    analyzer, vocabulary, idf = index
+    counts = Counter(
+        vocabulary[token] for token in analyzer(text) if token in vocabulary
+    )
+
+    columns = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+    values *= idf[columns]
+
+    norm = np.sqrt(np.dot(values, values))
+    if norm > 0:
+        values /= norm
+
+    return csr_matrix(
+        (values, columns, [0, len(columns)]),
+        shape=(1, len(vocabulary)),
+    )
 
 
 # ---------------- CONTENT GENERATORS ----------------
 
+_RESUME_TEMPLATE = (
+    "PROFESSIONAL RESUME\n\n"
+    "Target Role: {role}\n\n"
+    "PROFESSIONAL SUMMARY\n"
+    "Motivated professional seeking a role in this domain.\n"
+    "Strong foundation in technical skills and problem solving.\n\n"
+    "CORE SKILLS\n"
+    "- Python, Machine Learning, Streamlit, Data Analysis\n"
+    "- Communication, Teamwork, Problem Solving\n"
+    "- Tools: Git, Jupyter Notebook, VS Code\n\n"
+    "PROJECT EXPERIENCE\n"
+    "AI Resume & Portfolio Builder\n"
+    "- Built a ML model to classify resumes.\n"
+    "- Deployed an interactive app using Streamlit.\n\n"
+    "EDUCATION\n"
+    "Bachelor’s Degree in a relevant discipline\n\n"
+    "CERTIFICATIONS\n"
+    "- Python for Data Science\n"
+    "- Machine Learning Fundamentals\n\n"
+    "ADDITIONAL INFORMATION\n"
+    "Strong interest in continuous learning and AI applications.\n"
+)
+
+
 def generate_resume(role):
     """
     Generate a professional resume based on predicted role.
     """
-    return (
-        "PROFESSIONAL RESUME\n\n"
-        f"Target Role: {role}\n\n"
-        "PROFESSIONAL SUMMARY\n"
-        "Motivated professional seeking a role in this domain.\n"
-        "Strong foundation in technical skills and problem solving.\n\n"
-        "CORE SKILLS\n"
-        "- Python, Machine Learning, Streamlit, Data Analysis\n"
-        "- Communication, Teamwork, Problem Solving\n"
-        "- Tools: Git, Jupyter Notebook, VS Code\n\n"
-        "PROJECT EXPERIENCE\n"
-        "AI Resume & Portfolio Builder\n"
-        "- Built a ML model to classify resumes.\n"
-        "- Deployed an interactive app using Streamlit.\n\n"
-        "EDUCATION\n"
-        "Bachelor’s Degree in a relevant discipline\n\n"
-        "CERTIFICATIONS\n"
-        "- Python for Data Science\n"
-        "- Machine Learning Fundamentals\n\n"
-        "ADDITIONAL INFORMATION\n"
-        "Strong interest in continuous learning and AI applications.\n"
-    )
+    return _RESUME_TEMPLATE.format_map({"role": role})
+
+
+_COVER_LETTER_TEMPLATE = (
+    "Dear Hiring Manager,\n\n"
+    "I am applying for the {role} position at your organization.\n"
+    "I have strong technical skills and hands-on project experience.\n\n"
+    "I recently built an AI Resume & Portfolio Builder using\n"
+    "machine learning and Streamlit to automate document creation.\n\n"
+    "I am motivated, adaptable, and eager to contribute effectively.\n\n"
+    "Thank you for your time and consideration.\n\n"
+    "Sincerely,\n"
+    "Applicant\n"
+)
 
 
 def generate_cover_letter(role):
     """
     Generate a professional cover letter based on predicted role.
     """
-    return (
-        "Dear Hiring Manager,\n\n"
-        f"I am applying for the {role} position at your organization.\n"
-        "I have strong technical skills and hands-on project experience.\n\n"
-        "I recently built an AI Resume & Portfolio Builder using\n"
-        "machine learning and Streamlit to automate document creation.\n\n"
-        "I am motivated, adaptable, and eager to contribute effectively.\n\n"
-        "Thank you for your time and consideration.\n\n"
-        "Sincerely,\n"
-        "Applicant\n"
-    )
+    return _COVER_LETTER_TEMPLATE.format_map({"role": role})
+
+
+_PORTFOLIO_TEMPLATE = (
+    "PORTFOLIO PROFILE – {role}\n\n"
+    "ABOUT ME\n"
+    "Aspiring professional with strong interest in AI and software.\n\n"
+    "TECHNICAL SKILLS\n"
+    "- Python, SQL\n"
+    "- Machine Learning, NLP\n"
+    "- Streamlit\n"
+    "- Git, Jupyter, VS Code\n\n"
+    "PROJECTS\n"
+    "AI Resume & Portfolio Builder\n"
+    "- Built a resume classification model.\n"
+    "- Integrated into a Streamlit web app.\n\n"
+    "CAREER OBJECTIVE\n"
+    "To apply technical skills, grow professionally, and\n"
+    "contribute to innovative projects.\n\n"
+    "CONTACT\n"
+    "Email: your_email@example.com\n"
+    "GitHub: https://github.com/yourprofile\n"
+    "LinkedIn: https://linkedin.com/in/yourprofile\n"
+)
 
 
 def generate_portfolio(role):
     """
     Generate a professional portfolio profile based on predicted role.
     """
-    return (
-        f"PORTFOLIO PROFILE – {role}\n\n"
-        "ABOUT ME\n"
-        "Aspiring professional with strong interest in AI and software.\n\n"
-        "TECHNICAL SKILLS\n"
-        "- Python, SQL\n"
-        "- Machine Learning, NLP\n"
-        "- Streamlit\n"
-        "- Git, Jupyter, VS Code\n\n"
-        "PROJECTS\n"
-        "AI Resume & Portfolio Builder\n"
-        "- Built a resume classification model.\n"
-        "- Integrated into a Streamlit web app.\n\n"
-        "CAREER OBJECTIVE\n"
-        "To apply technical skills, grow professionally, and\n"
-        "contribute to innovative projects.\n\n"
-        "CONTACT\n"
-        "Email: your_email@example.com\n"
-        "GitHub: https://github.com/yourprofile\n"
-        "LinkedIn: https://linkedin.com/in/yourprofile\n"
-    )
+    return _PORTFOLIO_TEMPLATE.format_map({"role": role})
 
 
 # ---------------- STAGE 2: JOB CUSTOMIZATION ----------------
 
+_CUSTOMIZED_RESUME_TEMPLATE = (
+    "PROFESSIONAL RESUME (CUSTOMIZED)\n\n"
+    "Target Role: {role}\n\n"
+    "CUSTOMIZED SUMMARY\n"
+    "This resume has been tailored to align with the job description.\n\n"
+    "JOB DESCRIPTION KEY REQUIREMENTS\n"
+    "{job_description}\n\n"
+    "CANDIDATE PROFILE\n"
+    "{resume}\n\n"
+    "KEY ALIGNMENT\n"
+    "- Skills aligned with job requirements.\n"
+    "- Keywords optimized for ATS systems.\n"
+    "- Content adjusted to match role expectations.\n"
+)
+
+
 def customize_for_job(role, resume_input, job_desc):
     """
     Customize resume content based on the provided job description.
@@ -187,82 +354,157 @@ def customize_for_job(role, resume_input, job_desc):
     if job_desc.strip() == "":
         return generate_resume(role)
 
-    return (
-        "PROFESSIONAL RESUME (CUSTOMIZED)\n\n"
-        f"Target Role: {role}\n\n"
-        "CUSTOMIZED SUMMARY\n"
-        "This resume has been tailored to align with the job description.\n\n"
-        "JOB DESCRIPTION KEY REQUIREMENTS\n"
-        f"{job_desc}\n\n"
-        "CANDIDATE PROFILE\n"
-        f"{resume_input}\n\n"
-        "KEY ALIGNMENT\n"
-        "- Skills aligned with job requirements.\n"
-        "- Keywords optimized for ATS systems.\n"
-        "- Content adjusted to match role expectations.\n"
-    )
+    return _CUSTOMIZED_RESUME_TEMPLATE.format_map({
+        "role": role,
+        "job_description": job_desc,
+        "resume": resume_input,
+    })
 
 
 # ---------------- STAGE 1: FILE EXPORT ----------------
 
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+
+
+# Characters that are not allowed anywhere in an XML 1.0 document.
+_XML_INVALID_RE = re.compile(
+    r"[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]"
+)
+
+
+@st.cache_resource
+def _load_docx_skeleton():
+    """
+    Build an empty Word package once and split its document.xml
+    around the body, so documents can be written without python-docx.
+    """
+    source_buffer = BytesIO()
+    Document().save(source_buffer)
+
+    skeleton_buffer = BytesIO()
+    with zipfile.ZipFile(source_buffer) as source, zipfile.ZipFile(
+        skeleton_buffer, "w", zipfile.ZIP_DEFLATED
+    ) as skeleton:
+        for info in source.infolist():
+            if info.filename == "word/document.xml":
+                document_xml = source.read(info).decode("utf-8")
+            else:
+                skeleton.writestr(info, source.read(info))
+
+    body_start, body_tag, body_end = document_xml.partition("<w:body>")
+    return skeleton_buffer.getvalue(), body_start + body_tag, body_end
+
+
+def _docx_paragraph(block):
+    """
+    Render one text block as a WordprocessingML paragraph, with line
+    breaks between its lines and tab elements for tab characters.
+    """
+    lines = escape(_XML_INVALID_RE.sub("", block)).splitlines()
+    return (
+        "<w:p><w:r>"
+        + "<w:br/>".join(
+            "<w:t xml:space='preserve'>"
+            + "</w:t><w:tab/><w:t xml:space='preserve'>".join(
+                line.split("\t")
+            )
+            + "</w:t>"
+            for line in lines
+        )
+        + "</w:r></w:p>"
+    )
+
+
 def generate_word_file(text):
     """
     Convert text content into a Word (.docx) file.
     """
-    doc = Document()
-    for line in text.split("\n"):
-        doc.add_paragraph(line)
+    skeleton, body_start, body_end = _load_docx_skeleton()
+    paragraphs = "".join(
+        _docx_paragraph(block) for block in _BLANK_LINES_RE.split(text)
+    )
+
+    buffer = BytesIO(skeleton)
+    with zipfile.ZipFile(buffer, "a", zipfile.ZIP_DEFLATED) as package:
+        package.writestr(
+            "word/document.xml",
+            body_start + paragraphs + body_end,
+        )
 
-    buffer = BytesIO()
-    doc.save(buffer)
     buffer.seek(0)
     return buffer
 
 
 def generate_pdf_file(text):
     """
-    Convert text content into a PDF file.
+    Convert text content into PDF file bytes.
     """
     buffer = BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=A4)
+    pdf = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
     _, height = A4
-    y_position = height - 40
 
-    for line in text.split("\n"):
-        pdf.drawString(40, y_position, line)
-        y_position -= 14
+    text_object = pdf.beginText(40, height - 40)
+    text_object.setLeading(14)
 
-        if y_position < 40:
+    for line in text.splitlines():
+        if text_object.getY() < 40:
+            pdf.drawText(text_object)
             pdf.showPage()
-            y_position = height - 40
+            text_object = pdf.beginText(40, height - 40)
+            text_object.setLeading(14)
+
+        text_object.textLine(line)
 
+    pdf.drawText(text_object)
     pdf.save()
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=32, ttl="10m")
+def _docx_bytes(text):
+    """
+    Build the Word file for the given text once and reuse its bytes.
+    """
+    return generate_word_file(text).getvalue()
+
+
+@st.cache_data(max_entries=32, ttl="10m")
+def _pdf_bytes(text):
+    """
+    Build the PDF file for the given text once and reuse its bytes.
+    """
+    return generate_pdf_file(text)
 
 
 # ---------------- STAGE 3: PORTFOLIO WEBSITE ----------------
 
+_PORTFOLIO_WEBSITE_TEMPLATE = string.Template(
+    "<!DOCTYPE html>\n"
+    "<html lang='en'>\n"
+    "<head>\n"
+    "  <meta charset='UTF-8'>\n"
+    "  <meta name='viewport' content='width=device-width, "
+    "initial-scale=1.0'>\n"
+    "  <title>Portfolio - $role</title>\n"
+    "</head>\n"
+    "<body>\n\n"
+    "<h1>Portfolio – $role</h1>\n\n"
+    "<pre>\n"
+    "$body\n"
+    "</pre>\n\n"
+    "</body>\n"
+    "</html>\n"
+)
+
+
 def generate_portfolio_website(role, resume_input):
     """
     Generate a simple HTML portfolio website.
+    The role and resume text are HTML-escaped.
     """
-    return (
-        "<!DOCTYPE html>\n"
-        "<html lang='en'>\n"
-        "<head>\n"
-        "  <meta charset='UTF-8'>\n"
-        "  <meta name='viewport' content='width=device-width, "
-        "initial-scale=1.0'>\n"
-        f"  <title>Portfolio - {role}</title>\n"
-        "</head>\n"
-        "<body>\n\n"
-        f"<h1>Portfolio – {role}</h1>\n\n"
-        "<pre>\n"
-        f"{resume_input}\n"
-        "</pre>\n\n"
-        "</body>\n"
-        "</html>\n"
+    return _PORTFOLIO_WEBSITE_TEMPLATE.substitute(
+        role=html.escape(role),
+        body=html.escape(resume_input),
     )
 
 
@@ -306,101 +548,164 @@ with right_col:
 
 st.markdown("---")
 
-if st.button("Submit"):
-    if resume_text.strip() == "":
+
+def _input_digest(resume_text, job_description):
+    """
+    Return a short digest identifying the current text inputs.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(resume_text.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(job_description.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _stored_output(results, name, generator, *args):
+    """
+    Return a generated document from the stored results, building it
+    on first use.
+    """
+    if name not in results:
+        results[name] = generator(*args)
+    return results[name]
+
+
+@st.fragment
+def _submit_fragment(option, resume_text, job_description):
+    """
+    Run prediction and document generation when Submit is clicked.
+    Results are kept in session state, so reruns triggered by the
+    download buttons redraw them without predicting again.
+    """
+    submitted = st.button("Submit")
+
+    if submitted and resume_text.strip() == "":
         st.warning("Please enter resume text.")
-    else:
+        return
+
+    input_key = _input_digest(resume_text, job_description)
+    results = st.session_state.get("results")
+    is_current = results is not None and results["key"] == input_key
+
+    if submitted and not is_current:
+        model, _ = _load_artifacts()
+
         cleaned_input = clean_text(resume_text)
-        vectorized_input = tfidf.transform([cleaned_input])
+        vectorized_input = vectorize_text(cleaned_input)
         prediction = model.predict(vectorized_input)
 
-        predicted_role = prediction[0]
+        results = {"key": input_key, "option": option, "role": prediction[0]}
+        st.session_state["results"] = results
+    elif submitted:
+        results["option"] = option
+    elif not is_current or results["option"] != option:
+        return
+
+    predicted_role = results["role"]
 
-        st.markdown(
-            f"<div class='result-box'>"
-            f"Predicted Job Category: {predicted_role}"
-            f"</div>",
-            unsafe_allow_html=True,
+    st.html(
+        f"<div class='result-box'>"
+        f"Predicted Job Category: {html.escape(predicted_role)}"
+        f"</div>"
+    )
+
+    if option == "Predict Job Category":
+        st.info("Job category predicted successfully.")
+
+    elif option == "Generate Resume":
+        resume_output = _stored_output(
+            results,
+            "resume",
+            customize_for_job,
+            predicted_role,
+            resume_text,
+            job_description,
         )
 
-        if option == "Predict Job Category":
-            st.info("Job category predicted successfully.")
+        st.text_area(
+            "Generated Resume",
+            resume_output,
+            height=350,
+        )
 
-        elif option == "Generate Resume":
-            resume_output = customize_for_job(
-                predicted_role,
-                resume_text,
-                job_description,
-            )
+        st.download_button(
+            "Download Resume (Word)",
+            _docx_bytes(resume_output),
+            "resume.docx",
+        )
 
-            st.text_area(
-                "Generated Resume",
-                resume_output,
-                height=350,
-            )
+        st.download_button(
+            "Download Resume (PDF)",
+            _pdf_bytes(resume_output),
+            "resume.pdf",
+        )
 
-            st.download_button(
-                "Download Resume (Word)",
-                generate_word_file(resume_output),
-                "resume.docx",
-            )
+    elif option == "Generate Cover Letter":
+        cover_output = _stored_output(
+            results,
+            "cover",
+            generate_cover_letter,
+            predicted_role,
+        )
 
-            st.download_button(
-                "Download Resume (PDF)",
-                generate_pdf_file(resume_output),
-                "resume.pdf",
-            )
+        st.text_area(
+            "Generated Cover Letter",
+            cover_output,
+            height=350,
+        )
 
-        elif option == "Generate Cover Letter":
-            cover_output = generate_cover_letter(predicted_role)
+        st.download_button(
+            "Download Cover Letter (Word)",
+            _docx_bytes(cover_output),
+            "cover_letter.docx",
+        )
 
-            st.text_area(
-                "Generated Cover Letter",
-                cover_output,
-                height=350,
-            )
+        st.download_button(
+            "Download Cover Letter (PDF)",
+            _pdf_bytes(cover_output),
+            "cover_letter.pdf",
+        )
 
-            st.download_button(
-                "Download Cover Letter (Word)",
-                generate_word_file(cover_output),
-                "cover_letter.docx",
-            )
+    elif option == "Generate Portfolio":
+        portfolio_output = _stored_output(
+            results,
+            "portfolio",
+            generate_portfolio,
+            predicted_role,
+        )
 
-            st.download_button(
-                "Download Cover Letter (PDF)",
-                generate_pdf_file(cover_output),
-                "cover_letter.pdf",
-            )
+        st.text_area(
+            "Generated Portfolio",
+            portfolio_output,
+            height=350,
+        )
 
-        elif option == "Generate Portfolio":
-            portfolio_output = generate_portfolio(predicted_role)
+        st.download_button(
+            "Download Portfolio (Word)",
+            _docx_bytes(portfolio_output),
+            "portfolio.docx",
+        )
 
-            st.text_area(
-                "Generated Portfolio",
-                portfolio_output,
-                height=350,
-            )
+        st.download_button(
+            "Download Portfolio (PDF)",
+            _pdf_bytes(portfolio_output),
+            "portfolio.pdf",
+        )
 
-            st.download_button(
-                "Download Portfolio (Word)",
-                generate_word_file(portfolio_output),
-                "portfolio.docx",
-            )
+        website_html = _stored_output(
+            results,
+            "website",
+            generate_portfolio_website,
+            predicted_role,
+            resume_text,
+        )
 
-            st.download_button(
-                "Download Portfolio (PDF)",
-                generate_pdf_file(portfolio_output),
-                "portfolio.pdf",
-            )
+        st.download_button(
+            "Download Portfolio Website (HTML)",
+            website_html,
+            "portfolio.html",
+            mime="text/html",
+        )
 
-            website_html = generate_portfolio_website(
-                predicted_role,
-                resume_text,
-            )
 
-            st.download_button(
-                "Download Portfolio Website (HTML)",
-                website_html,
-                "portfolio.html",
-                mime="text/html",
-            )
+_submit_fragment(option, resume_text, job_description)